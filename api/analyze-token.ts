@@ -12,21 +12,54 @@ export const config = {
 const BIRDEYE_API_BASE = "https://public-api.birdeye.so";
 const MORALIS_API_BASE = "https://deep-index.moralis.io/api/v2.2";
 
+/**
+ * Per-attempt Birdeye timeout and retry budget. Bounds each Birdeye call only; the
+ * Claude request that follows has no timeout, so the handler can still hit maxDuration.
+ */
+const BIRDEYE_TIMEOUT_MS = 8000;
+const BIRDEYE_RETRIES = 2;
+const BIRDEYE_RETRY_BASE_MS = 1000;
+const BIRDEYE_MAX_RETRY_AFTER_MS = 10000;
+
 type Chain = "solana" | "base" | "bsc";
 
 const CHAINS: Chain[] = ["solana", "base", "bsc"];
 
+const EVM_ADDRESS_RE = /^0x[a-fA-F0-9]{40}$/;
+const SOLANA_ADDRESS_RE = /^[1-9A-HJ-NP-Za-km-z]{32,44}$/;
+
 function isEvmAddress(addr: string): boolean {
-  return /^0x[a-fA-F0-9]{40}$/.test((addr ?? "").trim());
+  return EVM_ADDRESS_RE.test((addr ?? "").trim());
 }
 
 function inferChain(address: string): Chain[] {
   const t = address.trim();
   if (isEvmAddress(t)) return ["base", "bsc"];
-  if (/^[1-9A-HJ-NP-Za-km-z]{32,44}$/.test(t)) return ["solana"];
+  if (SOLANA_ADDRESS_RE.test(t)) return ["solana"];
   return CHAINS;
 }
 
+function delay(ms: number): Promise<void> {
+  return new Promise((r) => setTimeout(r, ms));
+}
+
+/** Exponential backoff with jitter so parallel Birdeye calls don't retry in lockstep. */
+function backoffMs(attempt: number): number {
+  return BIRDEYE_RETRY_BASE_MS * Math.pow(2, attempt) + Math.random() * BIRDEYE_RETRY_BASE_MS;
+}
+
+/** Parse a Retry-After header (seconds or HTTP date) into ms, capped; null if absent/invalid. */
+function retryAfterMs(res: Response): number | null {
+  const header = res.headers.get("retry-after");
+  if (!header) return null;
+  const seconds = Number(header);
+  const ms = Number.isFinite(seconds)
+    ? seconds * 1000
+    : Date.parse(header) - Date.now();
+  if (!Number.isFinite(ms) || ms < 0) return null;
+  return Math.min(ms, BIRDEYE_MAX_RETRY_AFTER_MS);
+}
+
 function toBirdeyeChain(c: string): string {
   return c === "bnb" ? "bsc" : c;
 }
@@ -46,21 +79,41 @@ async function birdeyeFetch<T>(
   const url = new URL(`${BIRDEYE_API_BASE}${path}`);
   Object.entries(params).forEach(([k, v]) => url.searchParams.set(k, v));
 
-  const res = await fetch(url.toString(), {
-    method: "GET",
-    headers: {
-      "X-API-KEY": apiKey,
-      "x-chain": chain,
-      accept: "application/json",
-    },
-  });
+  for (let attempt = 0; ; attempt++) {
+    let res: Response;
+    try {
+      res = await fetch(url.toString(), {
+        method: "GET",
+        headers: {
+          "X-API-KEY": apiKey,
+          "x-chain": chain,
+          accept: "application/json",
+        },
+        signal: AbortSignal.timeout(BIRDEYE_TIMEOUT_MS),
+      });
+    } catch (e) {
+      // Network error or per-attempt timeout
+      if (attempt >= BIRDEYE_RETRIES) throw e;
+      await delay(backoffMs(attempt));
+      continue;
+    }
 
-  if (!res.ok) {
-    const text = await res.text();
-    throw new Error(`Birdeye API error ${res.status}: ${text.slice(0, 200)}`);
-  }
+    // Retry on rate limit (429) or server errors (5xx); honor Retry-After on 429
+    if ((res.status === 429 || res.status >= 500) && attempt < BIRDEYE_RETRIES) {
+      const wait =
+        (res.status === 429 ? retryAfterMs(res) : null) ?? backoffMs(attempt);
+      await res.body?.cancel();
+      await delay(wait);
+      continue;
+    }
 
-  return res.json();
+    if (!res.ok) {
+      const text = await res.text();
+      throw new Error(`Birdeye API error ${res.status}: ${text.slice(0, 200)}`);
+    }
+
+    return res.json();
+  }
 }
 
 async function moralisFetch(
@@ -1170,7 +1223,9 @@ export default async function handler(
       type: isEvmAddress(addr) ? "evm" : "solana",
     });
 
-    if (!addr || addr.length < 20) {
+    // Reject anything that is neither an EVM nor a base58 Solana address before
+    // fanning out to Birdeye/Moralis (otherwise inferChain tries every chain).
+    if (!addr || (!isEvmAddress(addr) && !SOLANA_ADDRESS_RE.test(addr))) {
       res.status(400).json({ error: "Invalid token address" });
       return;
     }
@@ -1226,11 +1281,19 @@ export default async function handler(
     }
 
     console.log("[analyze-token] solana path start");
+    // The address is a validated base58 Solana address here, so fetchTokenData tries a
+    // single chain (body.chain or "solana"); fetch txs alongside its overview/holder/security
+    // calls instead of waiting for it to resolve first.
+    const txsPromise = fetchTokenTransactions(
+      addr,
+      toBirdeyeChain(body.chain || "solana"),
+      150,
+    );
+
     const { chain, metadata, marketData, securityData, holders } =
       await fetchTokenData(addr, body.chain);
 
-    const birdeyeChain = toBirdeyeChain(chain);
-    const txs = await fetchTokenTransactions(addr, birdeyeChain, 150);
+    const txs = await txsPromise;
     const bundleResult = detectBundles(txs);
 
     const metrics = calculateMetrics(
@@ -311,9 +311,18 @@ export function Home() {
     }
 
     fetchTrending();
-    const intervalId = setInterval(fetchTrending, TRENDING_REFETCH_INTERVAL_MS);
+
+    const onVisibilityChange = () => {
+      if (document.visibilityState === "visible") fetchTrending();
+    };
+    document.addEventListener("visibilitychange", onVisibilityChange);
+
+    const intervalId = setInterval(() => {
+      if (document.visibilityState === "visible") fetchTrending();
+    }, TRENDING_REFETCH_INTERVAL_MS);
     return () => {
       cancelled = true;
+      document.removeEventListener("visibilitychange", onVisibilityChange);
       clearInterval(intervalId);
     };
   }, [trendingSortBy, trendingInterval, refreshTrendingTrigger]);
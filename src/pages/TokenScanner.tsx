@@ -3,7 +3,7 @@
  * Uses /api/analyze-token: real bundle detection, stepped reveal, predictions.
  * Tabs: Token (scan) | Discover (top traders + search)
  */
-import { useState, useCallback, useEffect, useRef } from "react";
+import { useState, useCallback, useEffect, useRef, memo } from "react";
 import { useNavigate, useLocation } from "react-router";
 import { motion } from "motion/react";
 import {
@@ -46,6 +46,7 @@ import { DocumentHead } from "@/components/DocumentHead";
 import { formatCurrency } from "@/lib/utils";
 import { TokenSearch } from "@/components/TokenSearch";
 import type { TokenSearchResult } from "@/lib/solanatracker";
+import { apiCache } from "@/lib/cache";
 
 const ANALYSIS_STEPS_SOLANA = [
   { key: "bundles", icon: Target, label: "Bundle Detection" },
@@ -67,8 +68,30 @@ const ANALYSIS_STEPS_EVM = [
   { key: "socials", icon: Globe, label: "Socials" },
 ] as const;
 
+/** Pacing of the stepped reveal; the full analysis is already loaded when it starts. */
+const REVEAL_STEP_MS = 650;
+const VERDICT_DELAY_MS = 1800;
+/** How long a token's analysis is reused when it is scanned again. */
+const ANALYSIS_CACHE_TTL_MS = 60 * 1000;
+
 type StatusKind = "safe" | "warning" | "danger" | "info" | "neutral";
 
+const STATUS_COLORS: Record<StatusKind, string> = {
+  safe: "text-emerald-500 border-emerald-500/40 bg-emerald-500/10",
+  warning: "text-amber-500 border-amber-500/40 bg-amber-500/10",
+  danger: "text-red-500 border-red-500/40 bg-red-500/10",
+  info: "text-white/60 border-white/20 bg-white/5",
+  neutral: "text-white/50 border-white/15 bg-white/5",
+};
+
+const STATUS_ICONS: Partial<
+  Record<StatusKind, React.ComponentType<{ className?: string }>>
+> = {
+  safe: CheckCircle2,
+  warning: AlertTriangle,
+  danger: XCircle,
+};
+
 interface TokenData {
   name: string;
   symbol: string;
@@ -117,6 +140,18 @@ interface AnalysisResult {
   recommendation?: string;
 }
 
+const PREDICTION_TIERS = [
+  { key: "conservative", badge: "SAFE BET", color: "text-emerald-400" },
+  { key: "moderate", badge: "BALANCED", color: "text-amber-400" },
+  { key: "aggressive", badge: "HIGH RISK", color: "text-red-400" },
+] as const;
+
+const PENDING_ANALYSIS_ITEM: AnalysisItem = {
+  value: "–",
+  status: "info",
+  reason: "Analysis pending",
+};
+
 type ScannerTab = "token" | "discover";
 
 interface TopTrader {
@@ -129,7 +164,8 @@ interface TopTrader {
   realizedPnL?: number;
 }
 
-function AnalysisRow({
+/** Memoized so already-revealed rows are not re-rendered on every reveal tick. */
+const AnalysisRow = memo(function AnalysisRow({
   data,
   icon: Icon,
   label,
@@ -141,21 +177,7 @@ function AnalysisRow({
   isAnalyzing?: boolean;
 }) {
   const status = (data?.status || "info") as StatusKind;
-  const StatusIcon =
-    status === "safe"
-      ? CheckCircle2
-      : status === "warning"
-        ? AlertTriangle
-        : status === "danger"
-          ? XCircle
-          : null;
-  const statusColors: Record<StatusKind, string> = {
-    safe: "text-emerald-500 border-emerald-500/40 bg-emerald-500/10",
-    warning: "text-amber-500 border-amber-500/40 bg-amber-500/10",
-    danger: "text-red-500 border-red-500/40 bg-red-500/10",
-    info: "text-white/60 border-white/20 bg-white/5",
-    neutral: "text-white/50 border-white/15 bg-white/5",
-  };
+  const StatusIcon = STATUS_ICONS[status] ?? null;
 
   return (
     <motion.div
@@ -188,7 +210,7 @@ function AnalysisRow({
               </p>
               {data?.value && (
                 <div
-                  className={`mt-2 inline-flex min-h-[44px] min-w-[44px] items-center gap-2 rounded-lg border px-3 py-2 text-xs font-medium ${statusColors[status]}`}
+                  className={`mt-2 inline-flex min-h-[44px] min-w-[44px] items-center gap-2 rounded-lg border px-3 py-2 text-xs font-medium ${STATUS_COLORS[status]}`}
                 >
                   {StatusIcon && <StatusIcon className="h-3.5 w-3.5" />}
                   {data.value}
@@ -200,7 +222,53 @@ function AnalysisRow({
       </div>
     </motion.div>
   );
-}
+});
+
+/** Memoized so the later verdict reveal does not re-render the prediction cards. */
+const PredictionGrid = memo(function PredictionGrid({
+  predictions,
+  currentMcap,
+}: {
+  predictions: NonNullable<AnalysisResult["marketCapPredictions"]>;
+  currentMcap: number;
+}) {
+  return (
+    <div className="grid gap-3 sm:grid-cols-3">
+      {PREDICTION_TIERS.map(({ key, badge, color }, idx) => {
+        const p = predictions[key];
+        return (
+          <motion.div
+            key={key}
+            initial={{ opacity: 0, y: 24, scale: 0.94 }}
+            animate={{ opacity: 1, y: 0, scale: 1 }}
+            transition={{ delay: idx * 0.12, duration: 0.5, ease: [0.4, 0, 0.2, 1] }}
+            whileHover={{ y: -4 }}
+            className="rounded-xl border border-white/10 bg-white/5 p-4 shadow-[0_4px_12px_rgba(0,0,0,0.2)] transition-shadow hover:shadow-[0_8px_20px_rgba(0,0,0,0.3)]"
+          >
+            <div
+              className={`mb-2 text-xs font-bold uppercase ${color}`}
+            >
+              {badge}
+            </div>
+            <div className="text-lg font-bold text-white">
+              {formatCurrency(p.mcap)}
+            </div>
+            <div className="text-xs text-white/50 line-through">
+              {formatCurrency(currentMcap)}
+            </div>
+            <div className={`mt-2 text-sm font-semibold ${color}`}>
+              {p.multiplier}
+            </div>
+            <div className="mt-3 flex items-center gap-2 text-xs text-white/60">
+              <Clock className="h-3.5 w-3.5" />
+              {p.timeframe} · {p.probability}% prob
+            </div>
+          </motion.div>
+        );
+      })}
+    </div>
+  );
+});
 
 function DiscoverTabContent() {
   const navigate = useNavigate();
@@ -613,12 +681,20 @@ export function TokenScanner() {
   const [showPredictions, setShowPredictions] = useState(false);
   const [showVerdict, setShowVerdict] = useState(false);
 
+  const inFlightAddressRef = useRef<string | null>(null);
+  const scanIdRef = useRef(0);
+
   const analysisSteps =
     chainType === "evm" ? ANALYSIS_STEPS_EVM : ANALYSIS_STEPS_SOLANA;
+  const totalSteps = analysisSteps.length;
 
   const analyzeToken = useCallback(async (addressOverride?: string) => {
     const addr = (addressOverride ?? tokenAddress).trim();
     if (!addr || addr.length < 32) return;
+    // Same token re-selected while its scan is still running: skip the duplicate request.
+    if (inFlightAddressRef.current === addr) return;
+    inFlightAddressRef.current = addr;
+    const scanId = ++scanIdRef.current;
 
     setLoading(true);
     setError(null);
@@ -630,17 +706,25 @@ export function TokenScanner() {
     setShowVerdict(false);
 
     try {
-      const base = getApiBase() || window.location.origin;
-      const res = await fetch(`${base}/api/analyze-token`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ tokenAddress: addr }),
-      });
+      // Re-scanning the same token shortly after reuses the previous result instead of a full analysis.
+      const cacheKey = `analyze_token_${addr}`;
+      let json = apiCache.get<any>(cacheKey);
+      if (!json) {
+        const base = getApiBase() || window.location.origin;
+        const res = await fetch(`${base}/api/analyze-token`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ tokenAddress: addr }),
+        });
 
-      const json = await res.json();
+        json = await res.json();
+        // A newer scan has started; drop this stale response.
+        if (scanIdRef.current !== scanId) return;
 
-      if (!res.ok) {
-        throw new Error(json.message || json.error || "Couldn't analyze this token. Please try again.");
+        if (!res.ok) {
+          throw new Error(json.message || json.error || "Couldn't analyze this token. Please try again.");
+        }
+        apiCache.set(cacheKey, json, ANALYSIS_CACHE_TTL_MS);
       }
 
       const { metadata, metrics, analysis: a, chainType: ct } = json;
@@ -665,11 +749,17 @@ export function TokenScanner() {
         telegram,
       });
 
-      setAnalysis(a);
+      // Fresh object so the reveal effect restarts even when the result came from cache.
+      setAnalysis(a ? { ...a } : null);
     } catch (err) {
-      setError(toUserMessage(err, "Couldn't analyze this token. Please try again."));
+      if (scanIdRef.current === scanId) {
+        setError(toUserMessage(err, "Couldn't analyze this token. Please try again."));
+      }
     } finally {
-      setLoading(false);
+      if (scanIdRef.current === scanId) {
+        inFlightAddressRef.current = null;
+        setLoading(false);
+      }
     }
   }, [tokenAddress]);
 
@@ -685,22 +775,34 @@ export function TokenScanner() {
 
   useEffect(() => {
     if (!analysis || loading) return;
+    // The result is already complete; skip the paced reveal when the user prefers reduced motion.
+    if (window.matchMedia("(prefers-reduced-motion: reduce)").matches) {
+      setCurrentStep(totalSteps);
+      setShowPredictions(true);
+      setShowVerdict(true);
+      return;
+    }
     setCurrentStep(0);
-    const steps = chainType === "evm" ? ANALYSIS_STEPS_EVM : ANALYSIS_STEPS_SOLANA;
+    // Step count lives in the effect so each tick issues plain setState calls that React
+    // batches into one render (the last tick reveals the final step and predictions together).
+    let step = 0;
+    let verdictTimeout: ReturnType<typeof setTimeout> | null = null;
     const id = setInterval(() => {
-      setCurrentStep((prev) => {
-        const next = prev + 1;
-        if (next >= steps.length) {
-          clearInterval(id);
-          setShowPredictions(true);
-          setTimeout(() => setShowVerdict(true), 1800);
-          return steps.length;
-        }
-        return next;
-      });
-    }, 650);
-    return () => clearInterval(id);
-  }, [analysis, loading, chainType]);
+      step += 1;
+      if (step >= totalSteps) {
+        clearInterval(id);
+        setCurrentStep(totalSteps);
+        setShowPredictions(true);
+        verdictTimeout = setTimeout(() => setShowVerdict(true), VERDICT_DELAY_MS);
+        return;
+      }
+      setCurrentStep(step);
+    }, REVEAL_STEP_MS);
+    return () => {
+      clearInterval(id);
+      if (verdictTimeout) clearTimeout(verdictTimeout);
+    };
+  }, [analysis, loading, totalSteps]);
 
   const handleCopy = () => {
     if (!tokenData?.contractAddress) return;
@@ -717,7 +819,7 @@ export function TokenScanner() {
 
   const getAnalysisItem = (key: string): AnalysisItem => {
     const item = analysis?.[key as keyof AnalysisResult] as AnalysisItem | undefined;
-    return item ?? { value: "–", status: "info", reason: "Analysis pending" };
+    return item ?? PENDING_ANALYSIS_ITEM;
   };
 
   const isRevealing = analysis && !loading && currentStep > 0;
@@ -941,13 +1043,13 @@ export function TokenScanner() {
             <div>
               <div className="mb-4 flex items-center justify-between">
                 <h2 className="text-base font-semibold text-white">
-                  {currentStep >= analysisSteps.length
+                  {currentStep >= totalSteps
                     ? "Analysis Complete"
                     : "AI Analysis in Progress…"}
                 </h2>
-                {currentStep < analysisSteps.length && (
+                {currentStep < totalSteps && (
                   <span className="text-xs text-white/50">
-                    {currentStep}/{analysisSteps.length}
+                    {currentStep}/{totalSteps}
                   </span>
                 )}
               </div>
@@ -956,7 +1058,7 @@ export function TokenScanner() {
                   className="h-full bg-[#12d585]"
                   initial={{ width: "0%" }}
                   animate={{
-                    width: `${Math.min((currentStep / analysisSteps.length) * 100, 100)}%`,
+                    width: `${Math.min((currentStep / totalSteps) * 100, 100)}%`,
                   }}
                   transition={{ duration: 0.4 }}
                 />
@@ -971,7 +1073,7 @@ export function TokenScanner() {
                       data={data}
                       icon={icon}
                       label={label}
-                      isAnalyzing={index === currentStep - 1 && currentStep < analysisSteps.length}
+                      isAnalyzing={index === currentStep - 1 && currentStep < totalSteps}
                     />
                   );
                 })}
@@ -985,43 +1087,7 @@ export function TokenScanner() {
               <h2 className="mb-3 text-base font-semibold text-[#12d585]">
                 Market Cap Predictions
               </h2>
-              <div className="grid gap-3 sm:grid-cols-3">
-                {(
-                [
-                  ["conservative", predictions.conservative, "SAFE BET", "text-emerald-400"],
-                  ["moderate", predictions.moderate, "BALANCED", "text-amber-400"],
-                  ["aggressive", predictions.aggressive, "HIGH RISK", "text-red-400"],
-                ] as const
-              ).map(([key, p, badge, color], idx) => (
-                  <motion.div
-                    key={key}
-                    initial={{ opacity: 0, y: 24, scale: 0.94 }}
-                    animate={{ opacity: 1, y: 0, scale: 1 }}
-                    transition={{ delay: idx * 0.12, duration: 0.5, ease: [0.4, 0, 0.2, 1] }}
-                    whileHover={{ y: -4 }}
-                    className="rounded-xl border border-white/10 bg-white/5 p-4 shadow-[0_4px_12px_rgba(0,0,0,0.2)] transition-shadow hover:shadow-[0_8px_20px_rgba(0,0,0,0.3)]"
-                  >
-                    <div
-                      className={`mb-2 text-xs font-bold uppercase ${color}`}
-                    >
-                      {badge}
-                    </div>
-                    <div className="text-lg font-bold text-white">
-                      {formatCurrency(p.mcap)}
-                    </div>
-                    <div className="text-xs text-white/50 line-through">
-                      {formatCurrency(currentMcap)}
-                    </div>
-                    <div className={`mt-2 text-sm font-semibold ${color}`}>
-                      {p.multiplier}
-                    </div>
-                    <div className="mt-3 flex items-center gap-2 text-xs text-white/60">
-                      <Clock className="h-3.5 w-3.5" />
-                      {p.timeframe} · {p.probability}% prob
-                    </div>
-                  </motion.div>
-                ))}
-              </div>
+              <PredictionGrid predictions={predictions} currentMcap={currentMcap} />
             </div>
           )}
 